@@ -1,5 +1,8 @@
 import os
 import logging
+import asyncio
+import contextlib
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 import httpx
@@ -20,10 +23,32 @@ logger = logging.getLogger("lingva-translate-server")
 LINGVA_API_URL = os.getenv("LINGVA_API_URL", "http://localhost:8001/api")
 TIME_API_URL = os.getenv("TIME_API_URL", "http://localhost:8002/api")
 
+# 共享的 HTTP 客户端，在所有工具调用之间复用连接池
+HTTP_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+    http2=True
+)
+
+# 翻译服务信息缓存，语言列表很少变化，缓存 5 分钟
+_INFO_TTL = 300
+_INFO_CACHE = {"ts": 0.0, "value": None}
+# 正在进行的刷新任务，缓存过期时并发的读取者共享同一次刷新的结果
+_INFO_REFRESH: Optional[asyncio.Task] = None
+
 # 创建FastMCP实例
 mcp = FastMCP("lingva-translate-server")
 
 
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+    """应用生命周期，在关闭时释放共享的 HTTP 客户端"""
+    try:
+        yield
+    finally:
+        await HTTP_CLIENT.aclose()
+
+
 @mcp.tool()
 async def translate_text(text: str, source_lang: str = "auto", target_lang: str = "zh") -> str:
     """将文本翻译成指定语言
@@ -37,28 +62,27 @@ async def translate_text(text: str, source_lang: str = "auto", target_lang: str
         包含翻译结果的字典
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{LINGVA_API_URL}/translate",
-                params={
-                    "text": text,
-                    "source_lang": source_lang,
-                    "target_lang": target_lang
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if not data.get("success"):
-                return f"翻译失败: {data.get('detail', '翻译失败')}"
-
-            result = data.get("result", {})
-            response_text = (
-                f"原文 ({result.get('source_language')}): {result.get('original_text')}\n"
-                f"译文 ({result.get('target_language')}): {result.get('translated_text')}\n"
-                f"翻译时间: {result.get('timestamp')}"
-            )
-            return response_text
+        response = await HTTP_CLIENT.get(
+            f"{LINGVA_API_URL}/translate",
+            params={
+                "text": text,
+                "source_lang": source_lang,
+                "target_lang": target_lang
+            }
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if not data.get("success"):
+            return f"翻译失败: {data.get('detail', '翻译失败')}"
+
+        result = data.get("result", {})
+        response_text = (
+            f"原文 ({result.get('source_language')}): {result.get('original_text')}\n"
+            f"译文 ({result.get('target_language')}): {result.get('translated_text')}\n"
+            f"翻译时间: {result.get('timestamp')}"
+        )
+        return response_text
     except httpx.RequestError as e:
         logger.error(f"翻译API请求错误: {str(e)}")
         return f"翻译API请求错误: {str(e)}"
@@ -76,63 +100,108 @@ async def get_current_time(timezone: str = "UTC", format: str = "%Y-%m-%d %H:%M:
         包含时间信息的字典
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TIME_API_URL}/time",
-                params={
-                    "timezone": timezone,
-                    "format": format
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if not data.get("success"):
-                return {"error": data.get("detail", "获取时间失败")}
-
-            result = data.get("result", {})
-            return {
-                "current_time": result.get("current_time"),
-                "timezone": result.get("timezone"),
-                "format": result.get("format"),
-                "utc_time": result.get("utc_time"),
-                "timestamp": result.get("timestamp")
+        response = await HTTP_CLIENT.get(
+            f"{TIME_API_URL}/time",
+            params={
+                "timezone": timezone,
+                "format": format
             }
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if not data.get("success"):
+            return {"error": data.get("detail", "获取时间失败")}
+
+        result = data.get("result", {})
+        return {
+            "current_time": result.get("current_time"),
+            "timezone": result.get("timezone"),
+            "format": result.get("format"),
+            "utc_time": result.get("utc_time"),
+            "timestamp": result.get("timestamp")
+        }
     except httpx.RequestError as e:
         logger.error(f"时间API请求错误: {str(e)}")
         return {"error": f"时间API请求错误: {str(e)}"}
 
 
+def _response_json(result: Any) -> Dict[str, Any]:
+    """解析并发请求的结果，请求失败时重新抛出对应的异常"""
+    if isinstance(result, BaseException):
+        raise result
+    result.raise_for_status()
+    return result.json()
+
+
 @mcp.resource("translate://lingva/query")
 async def get_translation_info() -> Dict[str, Any]:
     """获取翻译服务信息"""
+    global _INFO_REFRESH
+    now = time.monotonic()
+    if _INFO_CACHE["value"] and now - _INFO_CACHE["ts"] < _INFO_TTL:
+        return _INFO_CACHE["value"]
+
+    # 只发起一次刷新，无论成功还是失败，同一次刷新的结果返回给所有等待者
+    if _INFO_REFRESH is None:
+        _INFO_REFRESH = asyncio.create_task(_refresh_translation_info())
+        _INFO_REFRESH.add_done_callback(_finish_info_refresh)
+    return await asyncio.shield(_INFO_REFRESH)
+
+
+async def _refresh_translation_info() -> Dict[str, Any]:
+    """刷新翻译服务信息，只缓存完整的结果"""
+    service_info = await _fetch_translation_info()
+    if "error" not in service_info:
+        _INFO_CACHE["ts"] = time.monotonic()
+        _INFO_CACHE["value"] = service_info
+    return service_info
+
+
+def _finish_info_refresh(task: asyncio.Task) -> None:
+    """刷新结束后清除任务，下一次缓存未命中时重新刷新"""
+    global _INFO_REFRESH
+    _INFO_REFRESH = None
+    # 读取异常同时标记其已被处理，所有等待者都已取消时不会产生警告
+    if not task.cancelled():
+        task.exception()
+
+
+async def _fetch_translation_info() -> Dict[str, Any]:
+    """从上游获取翻译服务信息和语言列表"""
+    # 服务信息与语言列表互不依赖，并发请求
+    info_task = asyncio.create_task(HTTP_CLIENT.get(f"{LINGVA_API_URL}/info"))
+    languages_task = asyncio.create_task(HTTP_CLIENT.get(f"{LINGVA_API_URL}/languages"))
+    response, languages_response = await asyncio.gather(
+        info_task, languages_task, return_exceptions=True
+    )
+
+    # 其中一个请求失败时，仍然返回另一个请求的结果
+    errors = []
+    data = {}
+    languages_data = {}
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{LINGVA_API_URL}/info")
-            response.raise_for_status()
-            data = response.json()
-
-            # 获取语言列表
-            languages_response = await client.get(f"{LINGVA_API_URL}/languages")
-            languages_response.raise_for_status()
-            languages_data = languages_response.json()
-
-            return {
-                "service": data.get("service", "Lingva Translate"),
-                "description": data.get("description", "Free and Open Source Translation API"),
-                "supported_languages": languages_data.get("languages", []),
-                "active_api_endpoint": data.get("active_api_endpoint"),
-                "alternative_endpoints": data.get("alternative_endpoints", []),
-                "timestamp": datetime.now().isoformat()
-            }
-    except httpx.RequestError as e:
+        data = _response_json(response)
+    except httpx.HTTPError as e:
         logger.error(f"获取服务信息失败: {str(e)}")
-        return {
-            "service": "Lingva Translate",
-            "description": "Free and Open Source Translation API",
-            "error": f"获取服务信息失败: {str(e)}",
-            "timestamp": datetime.now().isoformat()
-        }
+        errors.append(f"获取服务信息失败: {str(e)}")
+    try:
+        languages_data = _response_json(languages_response)
+    except httpx.HTTPError as e:
+        logger.error(f"获取语言列表失败: {str(e)}")
+        errors.append(f"获取语言列表失败: {str(e)}")
+
+    service_info = {
+        "service": data.get("service", "Lingva Translate"),
+        "description": data.get("description", "Free and Open Source Translation API"),
+        "supported_languages": languages_data.get("languages", []),
+        "active_api_endpoint": data.get("active_api_endpoint"),
+        "alternative_endpoints": data.get("alternative_endpoints", []),
+        "timestamp": datetime.now().isoformat()
+    }
+    if errors:
+        service_info["error"] = "; ".join(errors)
+    return service_info
 
 
 if __name__ == "__main__":
@@ -156,4 +225,9 @@ if __name__ == "__main__":
     print(f"连接到翻译服务 API: {LINGVA_API_URL}")
     print(f"连接到时间服务 API: {TIME_API_URL}")
 
-    mcp.run(transport='sse')
\ No newline at end of file
+    # 挂载 FastMCP 的 SSE 应用，并通过 lifespan 管理共享客户端
+    starlette_app = Starlette(
+        routes=[Mount("/", app=mcp.sse_app())],
+        lifespan=lifespan
+    )
+    uvicorn.run(starlette_app, host=args.host, port=args.port, loop="uvloop", http="httptools")
\ No newline at end of file
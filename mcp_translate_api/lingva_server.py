@@ -1,10 +1,12 @@
 import os
 import logging
-from datetime import datetime
-from typing import Optional
+import contextlib
+import time
+from typing import Any, Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query
+import msgspec
+from fastapi import FastAPI, HTTPException, Query, Request
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -21,21 +23,66 @@ logger = logging.getLogger("lingva-api-server")
 # 初始化服务
 lingva_service = LingvaService()
 
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期，在关闭时释放翻译服务的 HTTP 客户端"""
+    try:
+        yield
+    finally:
+        await lingva_service.aclose()
+
 # 创建FastAPI应用
 app = FastAPI(
     title="Lingva Translate API",
     description="Lingva Translate API服务",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 定义请求模型
-class TranslationRequest(BaseModel):
+class TranslationRequest(msgspec.Struct):
     text: str
     source_lang: str = "auto"
     target_lang: str = "zh"
 
+_translation_request_decoder = msgspec.json.Decoder(TranslationRequest)
+# 请求体由 msgspec 解码，FastAPI 无法推断，单独为 OpenAPI 文档描述请求体
+_TRANSLATION_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {"schema": msgspec.json.schema_components([TranslationRequest])[1]["TranslationRequest"]}
+    }
+}
+
+# 定义响应模型，FastAPI 据此通过 Pydantic 直接序列化为 JSON
+class LanguagesResponse(BaseModel):
+    success: bool
+    languages: Any
+    timestamp: float
+
+class TranslationResult(BaseModel):
+    original_text: str
+    translated_text: str
+    source_language: str
+    target_language: str
+    timestamp: str
+    api_used: Optional[str] = None
+
+class TranslationResponse(BaseModel):
+    success: bool
+    result: TranslationResult
+    timestamp: str
+
+class ServiceInfoResponse(BaseModel):
+    service: str
+    description: str
+    active_api_endpoint: str
+    alternative_endpoints: list[str]
+    timestamp: float
+    error: Optional[str] = None
+
 # 定义API路由
-@app.get("/api/languages")
+@app.get("/api/languages", response_model=LanguagesResponse)
 async def get_languages():
     """获取支持的语言列表"""
     try:
@@ -43,15 +90,21 @@ async def get_languages():
         return {
             "success": True,
             "languages": languages,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
     except Exception as e:
         logger.error(f"获取语言列表失败: {str(e)}")
         raise HTTPException(status_code=500, detail=f"获取语言列表失败: {str(e)}")
 
-@app.post("/api/translate")
-async def translate(request: TranslationRequest):
+@app.post("/api/translate", response_model=TranslationResponse, response_model_exclude_none=True,
+          openapi_extra={"requestBody": _TRANSLATION_REQUEST_BODY})
+async def translate(raw_request: Request):
     """翻译文本"""
+    try:
+        request = _translation_request_decoder.decode(await raw_request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=f"请求参数无效: {str(e)}")
+
     try:
         result = await lingva_service.translate_text(
             request.text,
@@ -61,13 +114,13 @@ async def translate(request: TranslationRequest):
         return {
             "success": True,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": result["timestamp"]
         }
     except Exception as e:
         logger.error(f"翻译失败: {str(e)}")
         raise HTTPException(status_code=500, detail=f"翻译失败: {str(e)}")
 
-@app.get("/api/translate")
+@app.get("/api/translate", response_model=TranslationResponse, response_model_exclude_none=True)
 async def translate_get(
     text: str,
     source_lang: str = "auto",
@@ -83,13 +136,13 @@ async def translate_get(
         return {
             "success": True,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": result["timestamp"]
         }
     except Exception as e:
         logger.error(f"翻译失败: {str(e)}")
         raise HTTPException(status_code=500, detail=f"翻译失败: {str(e)}")
 
-@app.get("/api/info")
+@app.get("/api/info", response_model=ServiceInfoResponse, response_model_exclude_none=True)
 async def get_service_info():
     """获取服务信息"""
     try:
@@ -98,7 +151,7 @@ async def get_service_info():
             "description": "Free and Open Source Translation API (Google Translate frontend)",
             "active_api_endpoint": lingva_service.primary_api_url,
             "alternative_endpoints": lingva_service.api_alternatives,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
     except Exception as e:
         logger.error(f"获取服务信息失败: {str(e)}")
@@ -108,7 +161,7 @@ async def get_service_info():
             "error": f"获取服务信息失败: {str(e)}",
             "active_api_endpoint": lingva_service.primary_api_url,
             "alternative_endpoints": lingva_service.api_alternatives,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
 
 if __name__ == "__main__":
@@ -119,6 +172,7 @@ if __name__ == "__main__":
     parser.add_argument("--host", type=str, default="0.0.0.0", help="服务器主机")
     parser.add_argument("--api-url", type=str, help="Lingva API URL (默认: https://lingva.garudalinux.org/api/v1)")
     parser.add_argument("--add-api", type=str, action="append", help="添加备选 API 端点")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="工作进程数 (默认: CPU 核数)")
     args = parser.parse_args()
 
     if args.api_url:
@@ -126,10 +180,20 @@ if __name__ == "__main__":
 
     if args.add_api:
         for api in args.add_api:
-            if api not in lingva_service.api_alternatives:
-                lingva_service.api_alternatives.append(api)
+            lingva_service.add_alternative(api)
+
+    # 每个工作进程会重新导入本模块，通过环境变量传递端点配置
+    os.environ["LINGVA_API_URL"] = lingva_service.primary_api_url
+    os.environ["LINGVA_API_ALTERNATIVES"] = ",".join(lingva_service.api_alternatives)
 
     print(f"启动 Lingva 翻译 API 服务器在端口 {args.port}...")
     print(f"当前使用的 API 端点: {lingva_service.primary_api_url}")
     print(f"备选 API 端点: {', '.join(lingva_service.api_alternatives)}")
-    uvicorn.run(app, host=args.host, port=args.port)
\ No newline at end of file
+    uvicorn.run(
+        "lingva_server:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file
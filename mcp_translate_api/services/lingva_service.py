@@ -1,5 +1,7 @@
 import os
+import asyncio
 import logging
+import collections
 import urllib.parse
 from datetime import datetime
 from typing import List, Any, Dict
@@ -11,56 +13,87 @@ class LingvaService:
     """Lingva翻译服务封装类"""
     
     def __init__(self, primary_api_url=None, api_alternatives=None):
-        # 主API端点
-        self.primary_api_url = primary_api_url or os.getenv(
-            "LINGVA_API_URL", "https://lingva.garudalinux.org/api/v1"
-        )
-        
-        # 备选API端点列表
-        self.api_alternatives = api_alternatives or [
+        # 备选API端点列表，可通过逗号分隔的 LINGVA_API_ALTERNATIVES 环境变量指定
+        env_alternatives = os.getenv("LINGVA_API_ALTERNATIVES")
+        self.api_alternatives = api_alternatives or (env_alternatives.split(",") if env_alternatives else [
             "https://lingva.garudalinux.org/api/v1",
             "https://lingva.pussthecat.org/api/v1",
             "https://translate.plausibility.cloud/api/v1",
             "https://translate.dr460nf1r3.org/api/v1"
-        ]
+        ])
+
+        # 主API端点
+        self.primary_api_url = primary_api_url or os.getenv(
+            "LINGVA_API_URL", "https://lingva.garudalinux.org/api/v1"
+        )
+
+        # 共享的 HTTP 客户端，主端点与备选端点之间复用连接池
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+            http2=True
+        )
+
+        # 最近翻译结果的 LRU 缓存，键为 (源语言, 目标语言, 文本)
+        self._cache: collections.OrderedDict[tuple, dict] = collections.OrderedDict()
+        self._cache_max = 2048
+
+    async def aclose(self):
+        """关闭共享的 HTTP 客户端"""
+        await self._client.aclose()
+
+    def _set_endpoints(self, primary_api_url: str):
+        """重建去重后的不可变端点元组，主端点排在首位"""
+        self._endpoints = tuple(dict.fromkeys((primary_api_url, *self.api_alternatives)))
+        self._healthy_idx = 0
+
+    @property
+    def primary_api_url(self) -> str:
+        """当前可用的主API端点"""
+        return self._endpoints[self._healthy_idx]
+
+    @primary_api_url.setter
+    def primary_api_url(self, api_url: str):
+        self._set_endpoints(api_url)
+
+    def add_alternative(self, api_url: str):
+        """添加备选API端点"""
+        if api_url not in self.api_alternatives:
+            self.api_alternatives.append(api_url)
+            self._set_endpoints(self.primary_api_url)
     
     async def get_available_languages(self) -> List[dict]:
         """获取Lingva Translate支持的语言列表"""
         errors = []
 
-        # 首先尝试主API端点
-        try:
-            url = f"{self.primary_api_url}/languages"
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            errors.append(f"Primary API error: {str(e)}")
-            logger.warning(f"Primary API failed for languages, trying alternatives: {str(e)}")
-
-        # 如果主API端点失败，尝试备选端点
-        for alt_api_url in self.api_alternatives:
-            if alt_api_url == self.primary_api_url:
-                continue  # 跳过已经尝试过的主API端点
+        # 从当前可用的端点开始，依次尝试所有端点
+        start = self._healthy_idx
+        count = len(self._endpoints)
+        for i in range(count):
+            idx = (start + i) % count
+            api_url = self._endpoints[idx]
 
             try:
-                url = f"{alt_api_url}/languages"
-                logger.info(f"Trying alternative API for languages: {url}")
+                url = f"{api_url}/languages"
+                if i > 0:
+                    logger.info(f"Trying alternative API for languages: {url}")
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
+                response = await self._client.get(url)
+                response.raise_for_status()
 
+                if i > 0:
                     # 更新主API端点为成功的备选端点
-                    self.primary_api_url = alt_api_url
-                    logger.info(f"Updated primary API endpoint to: {self.primary_api_url}")
+                    self._healthy_idx = idx
+                    logger.info(f"Updated primary API endpoint to: {api_url}")
 
-                    return response.json()
+                return response.json()
             except Exception as e:
-                errors.append(f"Alternative API {alt_api_url} error: {str(e)}")
-                logger.warning(f"Alternative API failed for languages: {str(e)}")
+                if i == 0:
+                    errors.append(f"Primary API error: {str(e)}")
+                    logger.warning(f"Primary API failed for languages, trying alternatives: {str(e)}")
+                else:
+                    errors.append(f"Alternative API {api_url} error: {str(e)}")
+                    logger.warning(f"Alternative API failed for languages: {str(e)}")
 
         # 如果所有API端点都失败，返回一个基本的语言列表
         logger.error(f"All Lingva API endpoints failed for languages: {errors}")
@@ -73,62 +106,97 @@ class LingvaService:
             # 其他基本语言...
         ]
 
+    async def _translate_with(self, idx: int, source_lang: str, target_lang: str, encoded_text: str):
+        """使用指定序号的备选端点翻译，失败时异常信息中包含端点地址"""
+        api_url = self._endpoints[idx]
+        url = f"{api_url}/{source_lang}/{target_lang}/{encoded_text}"
+        logger.info(f"Trying alternative API: {url}")
+
+        try:
+            response = await self._client.get(url)
+            response.raise_for_status()
+            data = response.json()
+            return idx, data["translation"]
+        except Exception as e:
+            logger.warning(f"Alternative API failed: {str(e)}")
+            raise RuntimeError(f"Alternative API {api_url} error: {str(e)}") from e
+
     async def translate_text(self, text: str, source_lang: str, target_lang: str) -> Dict[str, Any]:
+        """翻译文本，相同的请求直接返回缓存的结果"""
+        key = (source_lang, target_lang, text)
+        hit = self._cache.get(key)
+        if hit:
+            self._cache.move_to_end(key)
+            return {**hit, "timestamp": datetime.now().isoformat()}
+
+        result = await self._request_translation(text, source_lang, target_lang)
+
+        self._cache[key] = result
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+        return {**result}
+
+    async def _request_translation(self, text: str, source_lang: str, target_lang: str) -> Dict[str, Any]:
         """向Lingva Translate API发送翻译请求"""
         errors = []
-        encoded_text = urllib.parse.quote(text)
+        encoded_text = urllib.parse.quote_from_bytes(text.encode("utf-8"), safe="")
+
+        # 请求开始时读取一次当前可用的端点
+        start = self._healthy_idx
+        count = len(self._endpoints)
 
         # 首先尝试主API端点
         try:
-            url = f"{self.primary_api_url}/{source_lang}/{target_lang}/{encoded_text}"
-            logger.info(f"Sending translation request to: {url}")
+            url = f"{self._endpoints[start]}/{source_lang}/{target_lang}/{encoded_text}"
+            logger.debug("Sending translation request to: %s", url)
+
+            response = await self._client.get(url)
+            logger.debug("Response status: %s", response.status_code)
+            response.raise_for_status()
+            data = response.json()
+
+            return {
+                "original_text": text,
+                "translated_text": data["translation"],
+                "source_language": source_lang,
+                "target_language": target_lang,
+                "timestamp": datetime.now().isoformat()
+            }
+        except Exception as e:
+            errors.append(f"Primary API error: {str(e)}")
+            logger.warning(f"Primary API failed, trying alternatives: {str(e)}")
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-                data = response.json()
+        # 并发尝试所有备选端点，采用最先成功的结果
+        tasks = [
+            asyncio.create_task(self._translate_with((start + i) % count, source_lang, target_lang, encoded_text))
+            for i in range(1, count)
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    idx, translated_text = await future
+                except Exception as e:
+                    errors.append(str(e))
+                    continue
+
+                # 更新主API端点
+                self._healthy_idx = idx
+                alt_api_url = self._endpoints[idx]
+                logger.info(f"Updated primary API endpoint to: {alt_api_url}")
 
                 return {
                     "original_text": text,
-                    "translated_text": data["translation"],
+                    "translated_text": translated_text,
                     "source_language": source_lang,
                     "target_language": target_lang,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now().isoformat(),
+                    "api_used": alt_api_url
                 }
-        except Exception as e:
-            errors.append(f"Primary API error: {str(e)}")
-            logger.warning(f"Primary API failed, trying alternatives: {str(e)}")
-
-        # 尝试备选端点
-        for alt_api_url in self.api_alternatives:
-            if alt_api_url == self.primary_api_url:
-                continue
-
-            try:
-                url = f"{alt_api_url}/{source_lang}/{target_lang}/{encoded_text}"
-                logger.info(f"Trying alternative API: {url}")
-
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    # 更新主API端点
-                    self.primary_api_url = alt_api_url
-                    logger.info(f"Updated primary API endpoint to: {self.primary_api_url}")
-
-                    return {
-                        "original_text": text,
-                        "translated_text": data["translation"],
-                        "source_language": source_lang,
-                        "target_language": target_lang,
-                        "timestamp": datetime.now().isoformat(),
-                        "api_used": alt_api_url
-                    }
-            except Exception as e:
-                errors.append(f"Alternative API {alt_api_url} error: {str(e)}")
-                logger.warning(f"Alternative API failed: {str(e)}")
+        finally:
+            # 取消仍在进行中的备选请求
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         # 所有API端点都失败
         error_message = "\n".join(errors)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import pytz
 from datetime import datetime
@@ -5,6 +6,45 @@ from typing import Dict, Any
 
 logger = logging.getLogger("time-service")
 
+# 有效时区集合，O(1) 判断时区是否合法
+_TZ_SET = frozenset(pytz.all_timezones)
+
+
+# 已加载的时区对象缓存
+_TZ_CACHE: Dict[str, Any] = {}
+
+
+def _load_tz(name: str):
+    """加载时区对象并放入缓存，首次加载会读取时区文件"""
+    tz = pytz.timezone(name)
+    _TZ_CACHE[name] = tz
+    return tz
+
+
+# 预加载常用时区，避免在请求路径上读取时区文件
+for _name in ("UTC", "Asia/Shanghai", "America/New_York", "Europe/London"):
+    _load_tz(_name)
+
+
+async def _get_tz(name: str):
+    """获取时区对象，未缓存的时区在线程中加载，避免阻塞事件循环"""
+    tz = _TZ_CACHE.get(name)
+    if tz is None:
+        tz = await asyncio.to_thread(_load_tz, name)
+    return tz
+
+
+# 默认的时间格式，走手写的快速格式化路径
+_DEFAULT_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _format_time(dt: datetime, format_str: str) -> str:
+    """格式化时间，默认格式不经过 strftime"""
+    if format_str == _DEFAULT_FMT:
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    return dt.strftime(format_str)
+
+
 class TimeService:
     """时间服务类"""
     
@@ -12,26 +52,26 @@ class TimeService:
     async def get_current_time(timezone: str = "UTC", format_str: str = "%Y-%m-%d %H:%M:%S") -> Dict[str, Any]:
         """获取指定时区的当前时间"""
         try:
-            # 获取当前UTC时间
-            utc_now = datetime.now(pytz.UTC)
-
-            # 转换到指定时区
-            if timezone not in pytz.all_timezones:
+            # 先校验时区，无效时区不做任何时间计算
+            if timezone not in _TZ_SET:
                 # 如果时区无效，记录警告并使用UTC
                 logger.warning(f"Invalid timezone: {timezone}, using UTC instead")
                 timezone = "UTC"
 
-            local_now = utc_now.astimezone(pytz.timezone(timezone))
+            # 直接获取指定时区的当前时间，再换算出UTC时间
+            tz = await _get_tz(timezone)
+            local_now = datetime.now(tz)
+            utc_now = local_now if tz is pytz.UTC else local_now.astimezone(pytz.UTC)
 
             # 格式化时间
-            formatted_time = local_now.strftime(format_str)
+            formatted_time = _format_time(local_now, format_str)
 
             # 返回结果
             return {
                 "current_time": formatted_time,
                 "timezone": timezone,
                 "format": format_str,
-                "utc_time": utc_now.strftime(format_str),
+                "utc_time": _format_time(utc_now, format_str),
                 "timestamp": utc_now.timestamp()
             }
         except Exception as e:
@@ -1,10 +1,10 @@
+import os
 import logging
-from datetime import datetime
 from typing import Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel
+import msgspec
+from fastapi import FastAPI, HTTPException, Query, Request
 from dotenv import load_dotenv
 
 # 导入服务类
@@ -28,14 +28,28 @@ app = FastAPI(
 )
 
 # 定义请求模型
-class TimeRequest(BaseModel):
+class TimeRequest(msgspec.Struct):
     timezone: str = "UTC"
     format: str = "%Y-%m-%d %H:%M:%S"
 
+_time_request_decoder = msgspec.json.Decoder(TimeRequest)
+# 请求体由 msgspec 解码，FastAPI 无法推断，单独为 OpenAPI 文档描述请求体
+_TIME_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {"schema": msgspec.json.schema_components([TimeRequest])[1]["TimeRequest"]}
+    }
+}
+
 # 定义API路由
-@app.post("/api/time")
-async def get_time(request: TimeRequest):
+@app.post("/api/time", openapi_extra={"requestBody": _TIME_REQUEST_BODY})
+async def get_time(raw_request: Request):
     """获取指定时区的当前时间"""
+    try:
+        request = _time_request_decoder.decode(await raw_request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=f"请求参数无效: {str(e)}")
+
     try:
         result = await time_service.get_current_time(
             request.timezone,
@@ -44,7 +58,7 @@ async def get_time(request: TimeRequest):
         return {
             "success": True,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": result["timestamp"]
         }
     except Exception as e:
         logger.error(f"获取时间失败: {str(e)}")
@@ -61,7 +75,7 @@ async def get_time_get(
         return {
             "success": True,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": result["timestamp"]
         }
     except Exception as e:
         logger.error(f"获取时间失败: {str(e)}")
@@ -73,7 +87,15 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="时间服务 API 服务器")
     parser.add_argument("--port", type=int, default=8002, help="服务器端口")
     parser.add_argument("--host", type=str, default="0.0.0.0", help="服务器主机")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="工作进程数 (默认: CPU 核数)")
     args = parser.parse_args()
 
     print(f"启动时间服务 API 服务器在端口 {args.port}...")
-    uvicorn.run(app, host=args.host, port=args.port)
\ No newline at end of file
+    uvicorn.run(
+        "time_server:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file
@@ -1,12 +1,14 @@
 import os
-import json
+import time
 import logging
+import weakref
 from datetime import datetime
 from collections.abc import Sequence
 from typing import Any, Optional
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 import httpx
+import orjson
 import asyncio
 import uvicorn
 import anyio
@@ -25,6 +27,8 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
+from sse_buffer import run_bounded
+
 # 加载环境变量
 load_dotenv()
 
@@ -43,38 +47,95 @@ http_headers = {
     "Content-Type": "application/json"
 }
 
+# 模型信息中不随请求变化的部分
+MODEL_INFO_STATIC = {
+    "description": "DeepSeek AI language model",
+    "capabilities": ["text generation", "question answering", "code generation"]
+}
+
+# 共享的异步 OpenAI 客户端，所有请求复用同一个连接池
+ASYNC_OAI = AsyncOpenAI(api_key=API_KEY, base_url="https://api.deepseek.com")
+
+# 每个 SSE 连接最多缓冲的出站消息数
+SSE_SEND_BUFFER_SIZE = 256
+
+# MCP 日志级别，从低到高
+MCP_LOG_LEVELS = ("debug", "info", "notice", "warning", "error", "critical", "alert", "emergency")
+
+# 流式增量内容的合并阈值：累计字符数或距上次发送的秒数
+SSE_FLUSH_CHARS = 512
+SSE_FLUSH_INTERVAL = 0.02
 
-async def query_deepseek(prompt: str, model: str = DEFAULT_MODEL) -> dict[str, Any]:
-    """向 DeepSeek API 发送查询请求"""
-    try:
-        # 创建 OpenAI 客户端
-        client = OpenAI(api_key=API_KEY, base_url="https://api.deepseek.com")
 
+def _api_error(e: Exception) -> RuntimeError:
+    """记录并包装 DeepSeek API 的异常"""
+    logger.error(f"DeepSeek API error: {str(e)}")
+    return RuntimeError(f"DeepSeek API error: {str(e)}")
+
+
+async def query_deepseek(prompt: str, model: str = DEFAULT_MODEL, on_delta=None) -> dict[str, Any]:
+    """向 DeepSeek API 发送流式查询请求，每收到一段增量内容时回调 on_delta
+
+    只有 API 的异常会被包装为 "DeepSeek API error"，on_delta 抛出的异常原样传播
+    """
+    try:
         # 调用 API
-        response = client.chat.completions.create(
+        stream = await ASYNC_OAI.chat.completions.create(
             model=model,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant"},
                 {"role": "user", "content": prompt},
             ],
-            stream=False
+            stream=True
         )
-
-        # 处理响应
-        return {
-            "model": response.model,
-            "response": response.choices[0].message.content,
-            "finish_reason": response.choices[0].finish_reason,
-            "timestamp": datetime.now().isoformat()
-        }
     except Exception as e:
-        logger.error(f"DeepSeek API error: {str(e)}")
-        raise RuntimeError(f"DeepSeek API error: {str(e)}")
+        raise _api_error(e)
+
+    # 逐段处理响应，提前结束（回调出错或被取消）时关闭上游响应，释放连接
+    parts = []
+    response_model = model
+    finish_reason = None
+    async with stream:
+        while True:
+            try:
+                chunk = await anext(stream)
+            except StopAsyncIteration:
+                break
+            except Exception as e:
+                raise _api_error(e)
+
+            response_model = chunk.model
+            if not chunk.choices:
+                continue
+
+            choice = chunk.choices[0]
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+            delta = choice.delta.content
+            if delta:
+                parts.append(delta)
+                if on_delta is not None:
+                    await on_delta(delta)
+
+    return {
+        "model": response_model,
+        "response": "".join(parts),
+        "finish_reason": finish_reason,
+        "timestamp": datetime.now().isoformat()
+    }
 
 
 def create_server_app():
     """创建 MCP 服务器应用"""
     app = Server("deepseek-sse-server")
+    # 各会话通过 logging/setLevel 设置的最低日志级别，未设置时为 info
+    session_levels: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @app.set_logging_level()
+    async def set_logging_level(level: LoggingLevel) -> None:
+        """设置当前会话接收日志通知的最低级别，同时声明 logging 能力"""
+        session_levels[app.request_context.session] = level
 
     @app.list_resources()
     async def list_resources() -> list[Resource]:
@@ -100,12 +161,11 @@ def create_server_app():
 
         model_info = {
             "model": model,
-            "description": "DeepSeek AI language model",
-            "capabilities": ["text generation", "question answering", "code generation"],
+            **MODEL_INFO_STATIC,
             "timestamp": datetime.now().isoformat()
         }
 
-        return json.dumps(model_info, indent=2)
+        return orjson.dumps(model_info, option=orjson.OPT_INDENT_2).decode()
 
     @app.list_tools()
     async def list_tools() -> list[Tool]:
@@ -144,8 +204,40 @@ def create_server_app():
         prompt = arguments["prompt"]
         model = arguments.get("model", DEFAULT_MODEL)
 
+        ctx = app.request_context
+        # 增量内容以 info 级别的日志通知发送，会话要求更高级别时不推送
+        level = session_levels.get(ctx.session, "info")
+        stream_deltas = MCP_LOG_LEVELS.index(level) <= MCP_LOG_LEVELS.index("info")
+        pending = []
+        pending_chars = 0
+        last_flush = time.monotonic()
+
+        async def flush_deltas():
+            """以日志通知的形式把累积的增量内容推送给客户端"""
+            nonlocal pending_chars, last_flush
+            if pending:
+                data = "".join(pending)
+                pending.clear()
+                pending_chars = 0
+                await ctx.session.send_log_message(
+                    level="info",
+                    data=data,
+                    logger="deepseek",
+                    related_request_id=ctx.request_id
+                )
+            last_flush = time.monotonic()
+
+        async def send_delta(delta: str):
+            """合并细碎的增量内容，攒够一定长度或时间后再发送"""
+            nonlocal pending_chars
+            pending.append(delta)
+            pending_chars += len(delta)
+            if pending_chars >= SSE_FLUSH_CHARS or time.monotonic() - last_flush > SSE_FLUSH_INTERVAL:
+                await flush_deltas()
+
         try:
-            result = await query_deepseek(prompt, model)
+            result = await query_deepseek(prompt, model, on_delta=send_delta if stream_deltas else None)
+            await flush_deltas()
 
             return [
                 TextContent(
@@ -170,9 +262,7 @@ def main(port: int = 8000):
         async with sse.connect_sse(
                 request.scope, request.receive, request._send
         ) as streams:
-            await app.run(
-                streams[0], streams[1], app.create_initialization_options()
-            )
+            await run_bounded(app, streams, SSE_SEND_BUFFER_SIZE)
 
     # 创建 Starlette 应用
     starlette_app = Starlette(
@@ -185,7 +275,7 @@ def main(port: int = 8000):
 
     # 启动服务器
     print(f"启动 DeepSeek SSE 服务器在端口 {port}...")
-    uvicorn.run(starlette_app, host="0.0.0.0", port=port)
+    uvicorn.run(starlette_app, host="0.0.0.0", port=port, loop="uvloop", http="httptools")
 
 
 if __name__ == "__main__":
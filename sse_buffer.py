@@ -0,0 +1,54 @@
+import logging
+
+import anyio
+import anyio.lowlevel
+
+logger = logging.getLogger("sse-buffer")
+
+
+class BoundedSendStream:
+    """有界的出站消息流，客户端消费过慢导致缓冲区写满时断开连接"""
+
+    def __init__(self, send_stream, on_overflow):
+        self._send_stream = send_stream
+        self._on_overflow = on_overflow
+
+    async def send(self, message):
+        try:
+            self._send_stream.send_nowait(message)
+        except anyio.WouldBlock:
+            logger.warning("SSE client is too slow, closing connection")
+            self._on_overflow()
+            # 取消后在检查点处抛出取消异常，连接正常关闭，而不是作为错误传播
+            await anyio.lowlevel.checkpoint()
+
+    async def aclose(self):
+        await self._send_stream.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+async def run_bounded(app, streams, max_buffer: int):
+    """在 SSE 连接上运行 MCP 服务器，出站消息最多缓冲 max_buffer 条
+
+    消息先写入有界缓冲区，再由后台任务转发到 SSE 连接，缓冲区写满时取消整个连接并正常返回
+    """
+    buffer_writer, buffer_reader = anyio.create_memory_object_stream(max_buffer)
+
+    async def forward_messages():
+        """把缓冲区中的消息依次转发到 SSE 连接"""
+        async with buffer_reader, streams[1]:
+            async for message in buffer_reader:
+                await streams[1].send(message)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(forward_messages)
+        await app.run(
+            streams[0],
+            BoundedSendStream(buffer_writer, tg.cancel_scope.cancel),
+            app.create_initialization_options()
+        )
@@ -0,0 +1,81 @@
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+import server_test
+
+
+class FakeStream:
+    """模拟 openai 的 AsyncStream，记录是否被关闭"""
+
+    def __init__(self, deltas, wait=None):
+        self._chunks = iter(deltas)
+        self._wait = wait
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._wait is not None:
+            await self._wait.wait()
+        try:
+            delta = next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+        choice = types.SimpleNamespace(finish_reason=None, delta=types.SimpleNamespace(content=delta))
+        return types.SimpleNamespace(model="deepseek-chat", choices=[choice])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.closed = True
+
+
+class QueryDeepseekStreamTest(unittest.IsolatedAsyncioTestCase):
+    """query_deepseek 在各种结束方式下都会关闭上游流"""
+
+    def use_stream(self, stream):
+        async def create(**kwargs):
+            return stream
+
+        patcher = mock.patch.object(server_test.ASYNC_OAI.chat.completions, "create", create)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_stream_closed_after_completion(self):
+        stream = FakeStream(["Hel", "lo"])
+        self.use_stream(stream)
+
+        result = await server_test.query_deepseek("hi")
+
+        self.assertEqual(result["response"], "Hello")
+        self.assertTrue(stream.closed)
+
+    async def test_callback_error_propagates_and_closes_stream(self):
+        stream = FakeStream(["Hel", "lo"])
+        self.use_stream(stream)
+
+        async def on_delta(delta):
+            raise BrokenPipeError("client gone")
+
+        with self.assertRaises(BrokenPipeError):
+            await server_test.query_deepseek("hi", on_delta=on_delta)
+        self.assertTrue(stream.closed)
+
+    async def test_cancellation_closes_stream(self):
+        stream = FakeStream(["Hel", "lo"], wait=asyncio.Event())
+        self.use_stream(stream)
+
+        task = asyncio.create_task(server_test.query_deepseek("hi"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(stream.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+import anyio
+import mcp.types as types
+from mcp.server import Server
+from mcp.shared.message import SessionMessage
+
+import sse_buffer
+
+
+class RunBoundedTest(unittest.IsolatedAsyncioTestCase):
+    """客户端消费过慢时，run_bounded 断开连接并正常返回"""
+
+    async def test_slow_client_is_disconnected_cleanly(self):
+        app = Server("test")
+        read_writer, read_stream = anyio.create_memory_object_stream(1000)
+        # 没有读取者的出站流，模拟停止消费的客户端
+        write_stream, stalled_reader = anyio.create_memory_object_stream(0)
+        for i in range(400):
+            request = types.JSONRPCMessage(types.JSONRPCRequest(jsonrpc="2.0", id=i, method="ping"))
+            await read_writer.send(SessionMessage(request))
+
+        with self.assertLogs("sse-buffer", level="WARNING") as logs:
+            with anyio.fail_after(5):
+                await sse_buffer.run_bounded(app, (read_stream, write_stream), 4)
+
+        self.assertIn("SSE client is too slow", logs.output[0])
+        read_writer.close()
+        stalled_reader.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import time
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+import translate_server
+
+
+class TranslateSingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    """translate_text 合并并发相同请求的行为"""
+
+    def setUp(self):
+        translate_server._translation_cache.clear()
+        translate_server._inflight.clear()
+        self.calls = 0
+        self.release = asyncio.Event()
+
+        async def fake_request(text, source_lang, target_lang):
+            self.calls += 1
+            await self.release.wait()
+            return {
+                "original_text": text,
+                "translated_text": text.upper(),
+                "source_language": source_lang,
+                "target_language": target_lang,
+                "timestamp": "t"
+            }
+
+        patcher = mock.patch.object(translate_server, "_request_translation", fake_request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_concurrent_requests_share_one_call(self):
+        tasks = [asyncio.create_task(translate_server.translate_text("hi", "en", "zh")) for _ in range(5)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result["translated_text"] == "HI" for result in results))
+        self.assertEqual(translate_server._inflight, {})
+        self.assertEqual(len(translate_server._translation_cache), 1)
+
+    async def test_cancelling_first_caller_does_not_cancel_others(self):
+        leader = asyncio.create_task(translate_server.translate_text("hi", "en", "zh"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(translate_server.translate_text("hi", "en", "zh"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+        result = await follower
+
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(result["translated_text"], "HI")
+        self.assertEqual(self.calls, 1)
+
+    async def test_request_finishes_when_all_callers_cancelled(self):
+        caller = asyncio.create_task(translate_server.translate_text("hi", "en", "zh"))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+        await asyncio.sleep(0.01)
+
+        # 结果仍然写入缓存，下一次请求直接命中
+        self.assertEqual(translate_server._inflight, {})
+        result = await translate_server.translate_text("hi", "en", "zh")
+        self.assertEqual(result["translated_text"], "HI")
+        self.assertEqual(self.calls, 1)
+
+    async def test_failure_reaches_every_caller(self):
+        async def failing_request(text, source_lang, target_lang):
+            self.calls += 1
+            await self.release.wait()
+            raise RuntimeError("boom")
+
+        with mock.patch.object(translate_server, "_request_translation", failing_request):
+            tasks = [asyncio.create_task(translate_server.translate_text("x", "en", "zh")) for _ in range(3)]
+            await asyncio.sleep(0)
+            self.release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(translate_server._translation_cache, {})
+
+
+class LanguageRefreshTest(unittest.IsolatedAsyncioTestCase):
+    """语言列表缓存过期时，并发读取者共享同一次刷新"""
+
+    def setUp(self):
+        translate_server._LANG_CACHE = None
+        self.calls = 0
+        self.result = None
+
+        async def fake_fetch():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return self.result
+
+        patcher = mock.patch.object(translate_server, "_fetch_available_languages", fake_fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_failed_refresh_answers_every_reader(self):
+        results = await asyncio.gather(*[translate_server.get_available_languages() for _ in range(4)])
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result is translate_server._FALLBACK_LANGUAGES for result in results))
+        self.assertIsNone(translate_server._LANG_CACHE)
+        self.assertIsNone(translate_server._lang_refresh)
+
+    async def test_failed_refresh_keeps_last_good_value(self):
+        stale = [{"code": "en", "name": "English"}]
+        translate_server._LANG_CACHE = (time.monotonic() - translate_server._LANG_CACHE_TTL, stale)
+
+        results = await asyncio.gather(*[translate_server.get_available_languages() for _ in range(4)])
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result is stale for result in results))
+
+    async def test_successful_refresh_is_cached(self):
+        self.result = [{"code": "zh", "name": "Chinese"}]
+        await asyncio.gather(*[translate_server.get_available_languages() for _ in range(4)])
+        await translate_server.get_available_languages()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(translate_server._LANG_CACHE[1], self.result)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    """端点熔断的打开、冷却、重新打开过程"""
+
+    URL = "https://mirror.example/api/v1"
+
+    def setUp(self):
+        translate_server._breaker.clear()
+        patcher = mock.patch.object(translate_server.time, "monotonic", return_value=100.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_opens_after_threshold(self):
+        for _ in range(translate_server._BREAKER_THRESHOLD - 1):
+            translate_server._record_failure(self.URL)
+        self.assertFalse(translate_server._breaker_open(self.URL))
+
+        translate_server._record_failure(self.URL)
+        self.assertTrue(translate_server._breaker_open(self.URL))
+
+    def test_closes_after_cooldown_and_reopens_on_next_failure(self):
+        for _ in range(translate_server._BREAKER_THRESHOLD):
+            translate_server._record_failure(self.URL)
+
+        self.clock.return_value = 100.0 + translate_server._BREAKER_COOLDOWN
+        self.assertFalse(translate_server._breaker_open(self.URL))
+
+        # 冷却后的第一次失败立即重新熔断
+        translate_server._record_failure(self.URL)
+        self.assertTrue(translate_server._breaker_open(self.URL))
+
+
+class BreakerFetchTest(unittest.IsolatedAsyncioTestCase):
+    """只有连接错误和 5xx 计入端点失败"""
+
+    async def asyncSetUp(self):
+        translate_server._breaker.clear()
+        self.status = {}
+
+        def handler(request):
+            status = self.status[request.url.host]
+            if status is None:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(status, json={"translation": "ok"})
+
+        translate_server._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await translate_server._client.aclose()
+        translate_server._client = None
+
+    async def get(self, host):
+        return await translate_server._hedged_get(
+            [f"https://{host}/api/v1"], "/en/zh/hi", lambda response: response.json()["translation"]
+        )
+
+    async def test_client_errors_do_not_count(self):
+        self.status["bad.example"] = 400
+        for _ in range(translate_server._BREAKER_THRESHOLD):
+            with self.assertRaises(RuntimeError):
+                await self.get("bad.example")
+        self.assertNotIn("https://bad.example/api/v1", translate_server._breaker)
+
+    async def test_server_and_transport_errors_count(self):
+        self.status["down.example"] = 503
+        self.status["dead.example"] = None
+        for host in ("down.example", "dead.example"):
+            with self.assertRaises(RuntimeError):
+                await self.get(host)
+            self.assertEqual(translate_server._breaker[f"https://{host}/api/v1"][0], 1)
+
+    async def test_success_resets_failures(self):
+        self.status["flaky.example"] = 503
+        with self.assertRaises(RuntimeError):
+            await self.get("flaky.example")
+
+        self.status["flaky.example"] = 200
+        self.assertEqual(await self.get("flaky.example"), ("https://flaky.example/api/v1", "ok"))
+        self.assertNotIn("https://flaky.example/api/v1", translate_server._breaker)
+
+
+if __name__ == "__main__":
+    unittest.main()
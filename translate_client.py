@@ -1,8 +1,8 @@
 import os
-import json
 import asyncio
 from typing import Any, Dict, List, Optional
 
+import orjson
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
 from mcp.types import Resource, Tool, TextContent
@@ -21,13 +21,17 @@ async def main(server_url: str):
                 print("已连接到 Lingva 翻译 SSE 服务器")
 
                 # 获取可用资源
-                resources = await session.list_resources()
+                resources = (await session.list_resources()).resources
                 print("\n可用资源:")
                 for resource in resources:
                     print(resource)
 
+                # 提前在后台获取支持的语言，与后续请求并发进行
+                resource_uri = resources[0].uri if resources else None
+                lang_task = asyncio.create_task(session.read_resource(resource_uri)) if resource_uri else None
+
                 # 获取可用工具
-                tools = await session.list_tools()
+                tools = (await session.list_tools()).tools
                 print("\n可用工具:")
                 for tool in tools:
                     print(tool)
@@ -35,10 +39,9 @@ async def main(server_url: str):
                 # 获取支持的语言
                 print("\n正在获取支持的语言...")
                 try:
-                    resource_uri = resources[0].uri if resources else None
-                    if resource_uri:
-                        languages_info = await session.read_resource(resource_uri)
-                        languages_data = json.loads(languages_info)
+                    if lang_task is not None:
+                        languages_info = await lang_task
+                        languages_data = orjson.loads(languages_info.contents[0].text)
                         if "supported_languages" in languages_data:
                             languages = languages_data["supported_languages"]
                             print("支持的语言:")
@@ -57,26 +60,31 @@ async def main(server_url: str):
                 # 交互式翻译文本
                 while True:
                     print("\n" + "=" * 50)
-                    text = input("请输入要翻译的文本 (输入 'exit' 退出): ")
+                    # 在线程中读取输入，避免阻塞事件循环上的 SSE 消息处理
+                    text = await asyncio.to_thread(input, "请输入要翻译的文本 (多段文本用 \\n 分隔，输入 'exit' 退出): ")
 
                     if text.lower() == 'exit':
                         break
 
-                    source_lang = input("请输入源语言代码 (默认 auto): ") or "auto"
-                    target_lang = input("请输入目标语言代码 (默认 zh): ") or "zh"
+                    source_lang = await asyncio.to_thread(input, "请输入源语言代码 (默认 auto): ") or "auto"
+                    target_lang = await asyncio.to_thread(input, "请输入目标语言代码 (默认 zh): ") or "zh"
 
                     print("\n正在翻译...")
 
-                    # 调用工具
-                    result = await session.call_tool("translate_text", {
-                        "text": text,
+                    # 调用工具，多段文本通过一次批量调用发送
+                    arguments = {
                         "source_lang": source_lang,
                         "target_lang": target_lang
-                    })
+                    }
+                    if "\\n" in text:
+                        arguments["texts"] = [line for line in text.split("\\n") if line]
+                    else:
+                        arguments["text"] = text
+                    result = await session.call_tool("translate_text", arguments)
 
                     print("\n翻译结果:")
                     # 处理结果
-                    for content in result:
+                    for content in result.content:
                         if hasattr(content, 'text'):
                             print(content.text)
                         else:
@@ -1,11 +1,17 @@
 import os
-import json
+import time
+import hashlib
 import logging
+import contextlib
+import functools
+import collections
 from datetime import datetime
 from collections.abc import Sequence
 from typing import Any, Optional, List
+from urllib.parse import quote as _quote
 
 import httpx
+import orjson
 import asyncio
 import uvicorn
 import anyio
@@ -24,6 +30,8 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
+from sse_buffer import run_bounded
+
 # 加载环境变量
 load_dotenv()
 
@@ -41,142 +49,390 @@ LINGVA_API_ALTERNATIVES = [
     "https://translate.dr460nf1r3.org/api/v1"
 ]
 
+# 每个 SSE 连接最多缓冲的出站消息数，客户端消费过慢写满时断开连接
+SSE_MAX_BUFFER = int(os.getenv("MCP_SSE_MAX_BUFFER", "256"))
 
-async def get_available_languages() -> List[dict]:
-    """获取 Lingva Translate 支持的语言列表"""
-    global LINGVA_API_URL
-    errors = []
+# 共享的 HTTP 客户端，在 lifespan 中创建，所有请求复用连接池
+_client: httpx.AsyncClient | None = None
 
-    # 首先尝试主 API 端点
+
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+    """应用生命周期，在运行中的事件循环上创建并最终关闭共享的 HTTP 客户端"""
+    global _client
+    _client = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+    )
     try:
-        url = f"{LINGVA_API_URL}/languages"
+        yield
+    finally:
+        await _client.aclose()
+        _client = None
+
+
+# 所有 API 端点都不可用时返回的基本语言列表，以便服务仍然可以运行
+_FALLBACK_LANGUAGES = [
+    {"code": "auto", "name": "Detect Language"},
+    {"code": "en", "name": "English"},
+    {"code": "zh", "name": "Chinese"},
+    {"code": "es", "name": "Spanish"},
+    {"code": "fr", "name": "French"},
+    {"code": "de", "name": "German"},
+    {"code": "ja", "name": "Japanese"},
+    {"code": "ko", "name": "Korean"},
+    {"code": "ru", "name": "Russian"}
+]
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        errors.append(f"Primary API error: {str(e)}")
-        logger.warning(f"Primary API failed for languages, trying alternatives: {str(e)}")
+# 语言列表缓存 (获取时间, 语言列表)，语言列表很少变化，缓存一小时
+_LANG_CACHE_TTL = 3600
+_LANG_CACHE: tuple[float, List[dict]] | None = None
+# 正在进行的刷新任务，缓存过期时并发的读取者共享同一次刷新的结果
+_lang_refresh: asyncio.Task | None = None
 
-    # 如果主 API 端点失败，尝试备选端点
-    for alt_api_url in LINGVA_API_ALTERNATIVES:
-        if alt_api_url == LINGVA_API_URL:
-            continue  # 跳过已经尝试过的主 API 端点
 
-        try:
-            url = f"{alt_api_url}/languages"
+async def get_available_languages() -> List[dict]:
+    """获取 Lingva Translate 支持的语言列表，成功的结果会被缓存"""
+    global _lang_refresh
+    if _LANG_CACHE is not None and time.monotonic() - _LANG_CACHE[0] < _LANG_CACHE_TTL:
+        return _LANG_CACHE[1]
 
-            logger.info(f"Trying alternative API for languages: {url}")
+    # 只发起一次刷新，无论成功还是失败，同一次刷新的结果返回给所有等待者
+    if _lang_refresh is None:
+        _lang_refresh = asyncio.create_task(_refresh_available_languages())
+        _lang_refresh.add_done_callback(_finish_lang_refresh)
+    return await asyncio.shield(_lang_refresh)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
 
-                # 更新主 API 端点为成功的备选端点
-                LINGVA_API_URL = alt_api_url
-                logger.info(f"Updated primary API endpoint to: {LINGVA_API_URL}")
+async def _refresh_available_languages() -> List[dict]:
+    """刷新语言列表缓存"""
+    global _LANG_CACHE
+    languages = await _fetch_available_languages()
+    if languages is None:
+        # 获取失败时不缓存，优先返回上一次成功的结果
+        return _LANG_CACHE[1] if _LANG_CACHE is not None else _FALLBACK_LANGUAGES
 
-                return response.json()
-        except Exception as e:
-            errors.append(f"Alternative API {alt_api_url} error: {str(e)}")
-            logger.warning(f"Alternative API failed for languages: {str(e)}")
-
-    # 如果所有 API 端点都失败，返回一个基本的语言列表
-    logger.error(f"All Lingva API endpoints failed for languages: {errors}")
-
-    # 返回一个基本的语言列表，以便服务仍然可以运行
-    return [
-        {"code": "auto", "name": "Detect Language"},
-        {"code": "en", "name": "English"},
-        {"code": "zh", "name": "Chinese"},
-        {"code": "es", "name": "Spanish"},
-        {"code": "fr", "name": "French"},
-        {"code": "de", "name": "German"},
-        {"code": "ja", "name": "Japanese"},
-        {"code": "ko", "name": "Korean"},
-        {"code": "ru", "name": "Russian"}
-    ]
+    _LANG_CACHE = (time.monotonic(), languages)
+    return languages
 
 
-async def translate_text(text: str, source_lang: str, target_lang: str) -> dict[str, Any]:
-    """向 Lingva Translate API 发送翻译请求"""
-    global LINGVA_API_URL
-    # 尝试所有可能的 API 端点
+def _finish_lang_refresh(task: asyncio.Task) -> None:
+    """刷新结束后清除任务，下一次缓存未命中时重新刷新"""
+    global _lang_refresh
+    _lang_refresh = None
+    # 读取异常同时标记其已被处理，所有等待者都已取消时不会产生警告
+    if not task.cancelled():
+        task.exception()
+
+
+# 按秒缓存的 ISO 时间戳 (秒, 时间戳)，同一秒内的请求复用同一个字符串
+_TS_CACHE: tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    """返回当前时间的 ISO 格式时间戳，精确到秒"""
+    global _TS_CACHE
+    sec = int(time.time())
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _TS_CACHE[1]
+
+
+# 对冲请求的延迟：主端点在该时间内没有成功时，并发请求备选端点
+HEDGE_DELAY = 0.3
+
+# 端点熔断：连续失败达到阈值后，在冷却时间内跳过该端点
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30
+# 端点 -> (连续失败次数, 熔断截止时间)
+_breaker: dict[str, tuple[int, float]] = {}
+
+
+def _breaker_open(api_url: str) -> bool:
+    """判断端点是否处于熔断状态"""
+    state = _breaker.get(api_url)
+    return state is not None and time.monotonic() < state[1]
+
+
+def _record_failure(api_url: str) -> None:
+    """记录一次端点失败（连接错误或 5xx），连续失败达到阈值时熔断该端点，冷却后再次失败会立即重新熔断"""
+    failures = _breaker.get(api_url, (0, 0.0))[0] + 1
+    if failures >= _BREAKER_THRESHOLD:
+        logger.warning(f"Circuit opened for {api_url} after {failures} consecutive failures")
+        _breaker[api_url] = (failures, time.monotonic() + _BREAKER_COOLDOWN)
+    else:
+        _breaker[api_url] = (failures, 0.0)
+
+
+async def _hedged_get(api_urls: List[str], path: str, parse) -> tuple[str, Any]:
+    """对冲请求：先请求首个端点，超过 HEDGE_DELAY 仍未成功时并发请求其余端点
+
+    返回最先成功的 (端点, 解析结果) 并取消其余请求，所有端点都失败时抛出 RuntimeError
+    """
+    async def fetch(api_url: str):
+        url = f"{api_url}{path}"
+        logger.debug("Sending request to: %s", url)
+        try:
+            response = await _client.get(url)
+        except httpx.TransportError:
+            _record_failure(api_url)
+            raise
+        logger.debug("Response status: %s", response.status_code)
+        # 只有连接错误和 5xx 才说明端点不可用，4xx 和解析错误是请求本身的问题
+        if response.is_server_error:
+            _record_failure(api_url)
+        else:
+            _breaker.pop(api_url, None)
+        response.raise_for_status()
+        return parse(response)
+
     errors = []
+    tasks = {asyncio.create_task(fetch(api_urls[0])): api_urls[0]}
+    hedged = False
+    try:
+        # 先单独等待主端点一小段时间
+        done, pending = await asyncio.wait(set(tasks), timeout=HEDGE_DELAY)
+        while True:
+            for task in done:
+                api_url = tasks[task]
+                if task.exception() is None:
+                    return api_url, task.result()
+
+                if api_url == api_urls[0]:
+                    errors.append(f"Primary API error: {str(task.exception())}")
+                    logger.warning(f"Primary API failed, trying alternatives: {str(task.exception())}")
+                else:
+                    errors.append(f"Alternative API {api_url} error: {str(task.exception())}")
+                    logger.warning(f"Alternative API failed: {str(task.exception())}")
+
+            # 主端点失败或超过对冲延迟，并发请求所有备选端点
+            if not hedged:
+                hedged = True
+                for api_url in api_urls[1:]:
+                    logger.info(f"Trying alternative API: {api_url}")
+                    task = asyncio.create_task(fetch(api_url))
+                    tasks[task] = api_url
+                    pending.add(task)
+
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # 取消仍在进行中的请求
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    raise RuntimeError("\n".join(errors))
+
+
+async def _get_with_failover(path: str, parse) -> tuple[str, Any]:
+    """在主端点和所有备选端点上请求 path，返回 (成功的端点, 解析结果)
+
+    成功的备选端点会成为新的主端点，所有端点都失败时抛出 RuntimeError
+    """
+    global LINGVA_API_URL
+    primary_api_url = LINGVA_API_URL
+    api_urls = list(dict.fromkeys([primary_api_url, *LINGVA_API_ALTERNATIVES]))
+    # 跳过熔断中的端点，全部熔断时仍然全部尝试，避免服务完全不可用
+    api_urls = [api_url for api_url in api_urls if not _breaker_open(api_url)] or api_urls
+
+    api_url, result = await _hedged_get(api_urls, path, parse)
+
+    # 只有主端点在请求期间没有被其他请求切换过时才更新，避免覆盖更新的结果
+    if api_url != primary_api_url and LINGVA_API_URL == primary_api_url:
+        LINGVA_API_URL = api_url
+        logger.info(f"Updated primary API endpoint to: {LINGVA_API_URL}")
+
+    return api_url, result
 
-    # URL 编码文本
-    import urllib.parse
-    encoded_text = urllib.parse.quote(text)
 
-    # 首先尝试主 API 端点
+async def _fetch_available_languages() -> List[dict] | None:
+    """从 Lingva Translate API 获取语言列表，所有端点都失败时返回 None"""
     try:
-        # 构建 API URL
-        url = f"{LINGVA_API_URL}/{source_lang}/{target_lang}/{encoded_text}"
+        _, languages = await _get_with_failover("/languages", lambda response: orjson.loads(response.content))
+        return languages
+    except RuntimeError as e:
+        logger.error(f"All Lingva API endpoints failed for languages: {str(e)}")
+        return None
 
-        logger.info(f"Sending translation request to: {url}")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
+# 翻译结果缓存，键为 (源语言, 目标语言, 文本摘要)，值为 (过期时间, 译文)
+_TRANSLATION_CACHE_MAX = 10_000
+_TRANSLATION_CACHE_TTL = 72 * 3600
+_translation_cache: collections.OrderedDict[tuple, tuple[float, str]] = collections.OrderedDict()
+# 正在进行中的翻译请求，相同的并发请求等待同一个任务
+_inflight: dict[tuple, asyncio.Task] = {}
 
-            # 记录响应状态
-            logger.info(f"Response status: {response.status_code}")
 
-            response.raise_for_status()
-            data = response.json()
+def _finish_translation(key: tuple, task: asyncio.Task) -> None:
+    """翻译任务结束时移出 _inflight，成功的结果写入缓存"""
+    del _inflight[key]
+    # 读取异常同时标记其已被处理，所有等待者都已取消时不会产生警告
+    if task.cancelled() or task.exception() is not None:
+        return
 
-            # 格式化翻译结果
-            translation_info = {
-                "original_text": text,
-                "translated_text": data["translation"],
-                "source_language": source_lang,
-                "target_language": target_lang,
-                "timestamp": datetime.now().isoformat()
-            }
+    # 只缓存译文本身，控制内存占用
+    _translation_cache[key] = (time.monotonic() + _TRANSLATION_CACHE_TTL, task.result()["translated_text"])
+    _translation_cache.move_to_end(key)
+    if len(_translation_cache) > _TRANSLATION_CACHE_MAX:
+        _translation_cache.popitem(last=False)
 
-            return translation_info
-    except Exception as e:
-        errors.append(f"Primary API error: {str(e)}")
-        logger.warning(f"Primary API failed, trying alternatives: {str(e)}")
 
-    # 如果主 API 端点失败，尝试备选端点
-    for alt_api_url in LINGVA_API_ALTERNATIVES:
-        if alt_api_url == LINGVA_API_URL:
-            continue  # 跳过已经尝试过的主 API 端点
+async def translate_text(text: str, source_lang: str, target_lang: str) -> dict[str, Any]:
+    """翻译文本，相同的请求在缓存有效期内直接返回缓存的译文，并发的相同请求只发送一次"""
+    key = (source_lang, target_lang, hashlib.blake2b(text.encode(), digest_size=16).digest())
+    now = time.monotonic()
+    hit = _translation_cache.get(key)
+    if hit is not None and hit[0] > now:
+        _translation_cache.move_to_end(key)
+        return {
+            "original_text": text,
+            "translated_text": hit[1],
+            "source_language": source_lang,
+            "target_language": target_lang,
+            "timestamp": _timestamp()
+        }
+
+    task = _inflight.get(key)
+    if task is None:
+        # 请求在独立的任务中运行，不属于任何一个调用者
+        task = asyncio.create_task(_request_translation(text, source_lang, target_lang))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_finish_translation, key))
+
+    # 每个调用者都通过 shield 等待，某个调用者被取消不会影响其他调用者
+    return dict(await asyncio.shield(task))
+
+
+async def _request_translation(text: str, source_lang: str, target_lang: str) -> dict[str, Any]:
+    """向 Lingva Translate API 发送翻译请求"""
+    primary_api_url = LINGVA_API_URL
 
-        try:
-            url = f"{alt_api_url}/{source_lang}/{target_lang}/{encoded_text}"
-
-            logger.info(f"Trying alternative API: {url}")
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-
-                # 格式化翻译结果
-                translation_info = {
-                    "original_text": text,
-                    "translated_text": data["translation"],
-                    "source_language": source_lang,
-                    "target_language": target_lang,
-                    "timestamp": datetime.now().isoformat(),
-                    "api_used": alt_api_url
+    # URL 编码文本，"/" 也需要编码，避免被当作路径分隔符
+    encoded_text = _quote(text, safe="")
+
+    try:
+        api_url, translated_text = await _get_with_failover(
+            f"/{source_lang}/{target_lang}/{encoded_text}",
+            lambda response: orjson.loads(response.content)["translation"]
+        )
+    except RuntimeError as e:
+        # 如果所有 API 端点都失败，抛出异常
+        logger.error(f"All Lingva API endpoints failed: {str(e)}")
+        raise RuntimeError(f"All Lingva API endpoints failed: {str(e)}")
+
+    # 格式化翻译结果
+    translation_info = {
+        "original_text": text,
+        "translated_text": translated_text,
+        "source_language": source_lang,
+        "target_language": target_lang,
+        "timestamp": _timestamp()
+    }
+
+    if api_url != primary_api_url:
+        translation_info["api_used"] = api_url
+
+    return translation_info
+
+
+# read_resource 响应体缓存：(语言列表, 主端点, 备选端点, 时间戳之前的部分, 时间戳之后的部分)
+_RESOURCE_CACHE: tuple[List[dict], str, tuple, bytes, bytes] | None = None
+_TIMESTAMP_PLACEHOLDER = "__timestamp__"
+
+
+def _render_service_info(languages: List[dict]) -> str:
+    """序列化服务信息，除时间戳外的部分在语言列表和端点不变时复用"""
+    global _RESOURCE_CACHE
+    alternatives = tuple(LINGVA_API_ALTERNATIVES)
+    if (
+        _RESOURCE_CACHE is None
+        or _RESOURCE_CACHE[0] is not languages
+        or _RESOURCE_CACHE[1] != LINGVA_API_URL
+        or _RESOURCE_CACHE[2] != alternatives
+    ):
+        service_info = {
+            "service": "Lingva Translate",
+            "description": "Free and Open Source Translation API (Google Translate frontend)",
+            "supported_languages": languages,
+            "active_api_endpoint": LINGVA_API_URL,
+            "alternative_endpoints": LINGVA_API_ALTERNATIVES,
+            "timestamp": _TIMESTAMP_PLACEHOLDER
+        }
+        body = orjson.dumps(service_info, option=orjson.OPT_INDENT_2)
+        prefix, suffix = body.split(orjson.dumps(_TIMESTAMP_PLACEHOLDER))
+        _RESOURCE_CACHE = (languages, LINGVA_API_URL, alternatives, prefix, suffix)
+
+    prefix, suffix = _RESOURCE_CACHE[3], _RESOURCE_CACHE[4]
+    return (prefix + orjson.dumps(_timestamp()) + suffix).decode()
+
+
+# 翻译服务信息资源的 URI
+_QUERY_URI = AnyUrl("translate://lingva/query")
+
+# 可用的翻译资源和工具在启动时构建一次，之后直接复用
+_RESOURCES = [
+    Resource(
+        uri=_QUERY_URI,
+        name="Lingva Translate API",
+        mimeType="application/json",
+        description="Lingva Translate API for text translation"
+    )
+]
+
+_TOOLS = [
+    Tool(
+        name="translate_text",
+        description="Translate text between languages using Lingva Translate",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to translate"
+                },
+                "texts": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Multiple texts to translate in one call, used instead of 'text'"
+                },
+                "source_lang": {
+                    "type": "string",
+                    "description": "Source language code (e.g., 'en', 'zh', 'auto' for auto-detection)",
+                    "default": "auto"
+                },
+                "target_lang": {
+                    "type": "string",
+                    "description": "Target language code (e.g., 'en', 'zh')",
+                    "default": "zh"
                 }
+            },
+            "required": ["target_lang"]
+        }
+    )
+]
 
-                # 更新主 API 端点为成功的备选端点
-                LINGVA_API_URL = alt_api_url
-                logger.info(f"Updated primary API endpoint to: {LINGVA_API_URL}")
 
-                return translation_info
-        except Exception as e:
-            errors.append(f"Alternative API {alt_api_url} error: {str(e)}")
-            logger.warning(f"Alternative API failed: {str(e)}")
+# 翻译结果的响应文本模板
+_RESP_TMPL = "原文 ({}): {}\n\n译文 ({}): {}\n{}翻译时间: {}"
 
-    # 如果所有 API 端点都失败，抛出异常
-    error_message = "\n".join(errors)
-    logger.error(f"All Lingva API endpoints failed: {error_message}")
-    raise RuntimeError(f"All Lingva API endpoints failed: {error_message}")
+
+def _format_result(result: dict[str, Any]) -> TextContent:
+    """把翻译结果格式化为友好的响应文本"""
+    api_line = f"使用的 API: {result['api_used']}\n" if "api_used" in result else ""
+    return TextContent(
+        type="text",
+        text=_RESP_TMPL.format(
+            result["source_language"],
+            result["original_text"],
+            result["target_language"],
+            result["translated_text"],
+            api_line,
+            result["timestamp"]
+        )
+    )
 
 
 def create_server_app():
@@ -186,32 +442,15 @@ def create_server_app():
     @app.list_resources()
     async def list_resources() -> list[Resource]:
         """列出可用的翻译资源"""
-        uri = AnyUrl(f"translate://lingva/query")
-        return [
-            Resource(
-                uri=uri,
-                name="Lingva Translate API",
-                mimeType="application/json",
-                description="Lingva Translate API for text translation"
-            )
-        ]
+        return _RESOURCES
 
     @app.read_resource()
     async def read_resource(uri: AnyUrl) -> str:
         """读取翻译服务的信息"""
-        if str(uri).startswith("translate://") and str(uri).endswith("/query"):
+        if uri == _QUERY_URI:
             try:
                 languages = await get_available_languages()
-
-                service_info = {
-                    "service": "Lingva Translate",
-                    "description": "Free and Open Source Translation API (Google Translate frontend)",
-                    "supported_languages": languages,
-                    "active_api_endpoint": LINGVA_API_URL,
-                    "alternative_endpoints": LINGVA_API_ALTERNATIVES,
-                    "timestamp": datetime.now().isoformat()
-                }
-                return json.dumps(service_info, indent=2)
+                return _render_service_info(languages)
             except Exception as e:
                 logger.error(f"Error fetching languages: {str(e)}")
                 service_info = {
@@ -220,41 +459,16 @@ def create_server_app():
                     "error": f"Could not fetch supported languages: {str(e)}",
                     "active_api_endpoint": LINGVA_API_URL,
                     "alternative_endpoints": LINGVA_API_ALTERNATIVES,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _timestamp()
                 }
-                return json.dumps(service_info, indent=2)
+                return orjson.dumps(service_info, option=orjson.OPT_INDENT_2).decode()
         else:
             raise ValueError(f"Unknown resource: {uri}")
 
     @app.list_tools()
     async def list_tools() -> list[Tool]:
         """列出可用的翻译工具"""
-        return [
-            Tool(
-                name="translate_text",
-                description="Translate text between languages using Lingva Translate",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "Text to translate"
-                        },
-                        "source_lang": {
-                            "type": "string",
-                            "description": "Source language code (e.g., 'en', 'zh', 'auto' for auto-detection)",
-                            "default": "auto"
-                        },
-                        "target_lang": {
-                            "type": "string",
-                            "description": "Target language code (e.g., 'en', 'zh')",
-                            "default": "zh"
-                        }
-                    },
-                    "required": ["text", "target_lang"]
-                }
-            )
-        ]
+        return _TOOLS
 
     @app.call_tool()
     async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
@@ -262,29 +476,26 @@ def create_server_app():
         if name != "translate_text":
             raise ValueError(f"Unknown tool: {name}")
 
-        if not isinstance(arguments, dict) or "text" not in arguments or "target_lang" not in arguments:
-            raise ValueError("Invalid arguments: 'text' and 'target_lang' are required")
-
-        text = arguments["text"]
+        if (
+            not isinstance(arguments, dict)
+            or ("text" not in arguments and "texts" not in arguments)
+            or "target_lang" not in arguments
+        ):
+            raise ValueError("Invalid arguments: 'text' (or 'texts') and 'target_lang' are required")
+
+        # 批量模式一次调用翻译多段文本，减少 MCP 往返次数
+        texts = arguments["texts"] if "texts" in arguments else [arguments["text"]]
+        if not isinstance(texts, list) or not texts:
+            raise ValueError("Invalid arguments: 'texts' must be a non-empty list")
         source_lang = arguments.get("source_lang", "auto")
         target_lang = arguments["target_lang"]
 
         try:
-            result = await translate_text(text, source_lang, target_lang)
-
-            # 构建友好的响应文本
-            response_text = f"原文 ({result['source_language']}): {result['original_text']}\n\n"
-            response_text += f"译文 ({result['target_language']}): {result['translated_text']}\n"
-            if "api_used" in result:
-                response_text += f"使用的 API: {result['api_used']}\n"
-            response_text += f"翻译时间: {result['timestamp']}"
-
-            return [
-                TextContent(
-                    type="text",
-                    text=response_text
-                )
-            ]
+            # 多段文本并发翻译，共享同一个连接池
+            results = await asyncio.gather(
+                *[translate_text(text, source_lang, target_lang) for text in texts]
+            )
+            return [_format_result(result) for result in results]
         except Exception as e:
             logger.error(f"Translation API error: {str(e)}")
             raise RuntimeError(f"Translation API error: {str(e)}")
@@ -302,9 +513,7 @@ def main(port: int = 8002):
         async with sse.connect_sse(
                 request.scope, request.receive, request._send
         ) as streams:
-            await app.run(
-                streams[0], streams[1], app.create_initialization_options()
-            )
+            await run_bounded(app, streams, SSE_MAX_BUFFER)
 
     # 创建 Starlette 应用
     starlette_app = Starlette(
@@ -313,13 +522,22 @@ def main(port: int = 8002):
             Route("/sse", endpoint=handle_sse),
             Mount("/messages/", app=sse.handle_post_message),
         ],
+        lifespan=lifespan,
     )
 
     # 启动服务器
     print(f"启动 Lingva 翻译 SSE 服务器在端口 {port}...")
     print(f"当前使用的 API 端点: {LINGVA_API_URL}")
     print(f"备选 API 端点: {', '.join(LINGVA_API_ALTERNATIVES)}")
-    uvicorn.run(starlette_app, host="0.0.0.0", port=port)
+    uvicorn.run(
+        starlette_app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+        access_log=False
+    )
 
 
 if __name__ == "__main__":